@@ -8,6 +8,8 @@ N.B. The extracted files are only meant to be used as input to squidnote2xopp
 and are not intended to be loaded by SquidNote, and so they have not been tested
 for that use case.
 
+Requires Python 3.11 or newer.
+
 Version 1.0.0 (2023-05-26)
 Copyright (c) 2023, ZJ Laczik
 
@@ -16,6 +18,9 @@ Please submit suggestions, feature requests and bug reports on https://github.co
 
 quiet = False
 
+# precompiled slugify() pattern, set up by compile_patterns() once "re" is imported
+_SLUG_NONWORD = None
+
 ########################################
 def import_libraries() :
 	"""
@@ -26,11 +31,13 @@ def import_libraries() :
 	"""
 	named_libs = [
 		'sys',
+		'os',
 		'io',
 		'inspect',
 		're',
 		'struct',
 		'datetime',
+		'collections',
 		'unicodedata',
 
 		'tempfile',
@@ -43,6 +50,9 @@ def import_libraries() :
 		('numpy', 'np'),
 		'cv2',
 
+		'threading',
+		('concurrent.futures', 'futures'),
+
 		'argparse'
 	]
 	try :
@@ -86,9 +96,11 @@ def mprint( *args, **kwargs) :
 		colour = CWHITE
 
 	if not quiet :
-		print( datetime.datetime.now(), ' ', colour, file=sys.stderr, end='' )
-		print( *args, **kwargs, file=sys.stderr, end='' )
-		print( CEND, file=sys.stderr )
+		# build the whole line first and write it with one call, so that messages
+		# from different worker threads do not interleave
+		sep = kwargs.get( 'sep', ' ' )
+		message = sep.join( str( arg ) for arg in args )
+		print( f'{datetime.datetime.now()}   {colour}{message}{CEND}\n', file=sys.stderr, end='' )
 
 
 ########################################
@@ -108,13 +120,185 @@ def slugify(value, allow_unicode=False):
 #	value = re.sub(r'[^\w\s-]', '', value.lower())
 #	return re.sub(r'[-\s]+', '-', value).strip('-_')
 	# replace all non word characters with '_'
-	value = re.sub(r'[^-\w]', '_', value)
-	# strip leading whitespace, '/' and '_'
-	value = re.sub(r'^[-_/]+', '', value)
-	# strip trailing whitespace, '/' and '_'
-	value = re.sub(r'[-_/]+$', '', value)
+	value = _SLUG_NONWORD.sub('_', value)
+	# strip leading and trailing '-', '/' and '_'
+	value = value.strip('-_/')
 	return value
 
+########################################
+def compile_patterns() :
+	"""
+	Compile the regular expression used by slugify() once, rather than
+	going through the re module cache on every call.
+	"""
+	global _SLUG_NONWORD
+
+	_SLUG_NONWORD = re.compile(r'[^-\w]')
+
+########################################
+def open_backup_archive( worker_state, snb_file, opened ) :
+	"""
+	Thread pool initializer: open the backup archive once for each worker thread
+	(ZipFile objects must not be shared between threads for reading, and opening
+	one reads the whole central directory, so it is not reopened for every note).
+	The ZipFile is added to "opened" so that it can be closed when all work is done.
+	"""
+	worker_state.sn_bup = zipfile.ZipFile( snb_file, 'r' )
+	# member name -> ZipInfo lookup of the backup archive, resolved once per worker
+	# and used to open members directly
+	worker_state.info_by_name = worker_state.sn_bup.NameToInfo
+	opened.append( worker_state.sn_bup )
+
+########################################
+def extract_note( note, sn_file, worker_state, docs_by_note, pages_by_note, images_by_page ) :
+	"""
+	Extract a single note from the backup archive into its own squidnote archive.
+	Runs in a worker thread, using the backup archive opened for that thread by
+	open_backup_archive().
+	"""
+	uuid, nn, mtime, ts = note
+	sn_bup = worker_state.sn_bup
+	info_by_name = worker_state.info_by_name
+	# open ZipFile archive for note being extracted				
+	with zipfile.ZipFile( sn_file, 'w', compression=zipfile.ZIP_STORED, allowZip64=True ) as sn :
+		mprint( f'Opened new squidnote archive for writing' )
+	
+		image_set = set()
+		pdf_set = set()
+	
+		# create info.json
+		sn.writestr( 'info.json', f'{{"id":"{uuid}","name":"{nn}","modified":{ts},"version":1}}' )
+
+		# crete note.db in memory
+		#   N.B. isolation_level=None stops the sqlite3 module opening its own transactions, see BEGIN below
+		new_db_conn = sqlite3.connect( ':memory:', isolation_level=None )
+		new_db_cursor = new_db_conn.cursor()
+		sql_cmds = (
+			'''CREATE TABLE android_metadata (locale TEXT)''',
+			'''CREATE TABLE document(
+				documentId TEXT NOT NULL,
+				noteId TEXT NOT NULL,
+				encryptedPassword TEXT
+			)''',
+			'''CREATE TABLE folder(
+				id TEXT PRIMARY KEY NOT NULL,
+				name TEXT NOT NULL,
+				created INTEGER NOT NULL,
+				trashed INTEGER,
+				parentId TEXT
+			)''',
+			'''CREATE TABLE image( imageId TEXT NOT NULL, pageId TEXT NOT NULL, toDelete INTEGER NOT NULL )''',
+			'''CREATE TABLE manifest( revision INTEGER NOT NULL )''',
+			'''CREATE TABLE note(
+				id TEXT PRIMARY KEY NOT NULL,
+				name TEXT NOT NULL,
+				created INTEGER NOT NULL,
+				modified INTEGER NOT NULL,
+				starred INTEGER NOT NULL DEFAULT 0,
+				uiMode INTEGER NOT NULL DEFAULT 0,
+				currentPageNum INTEGER NOT NULL DEFAULT 0,
+				passwordHash TEXT,
+				version INTEGER NOT NULL DEFAULT 0,
+				trashed INTEGER,
+				parentId TEXT,
+				revision INTEGER NOT NULL DEFAULT 0
+			)''',
+			'''CREATE TABLE page(
+				id TEXT PRIMARY KEY NOT NULL,
+				noteId TEXT NOT NULL,
+				created INTEGER NOT NULL,
+				modified INTEGER NOT NULL,
+				pageNum INTEGER NOT NULL,
+				offsetX REAL NOT NULL DEFAULT 0,
+				offsetY REAL NOT NULL DEFAULT 0,
+				zoom REAL NOT NULL DEFAULT 1,
+				fitMode INTEGER NOT NULL DEFAULT 0,
+				documentId TEXT
+			)'''
+		)
+		# build the whole database in a single transaction
+		#   N.B. executescript() commits any pending transaction first, so BEGIN is part of the script
+		new_db_cursor.executescript( 'BEGIN IMMEDIATE;\n' + ';\n'.join( sql_cmds ) + ';' )
+
+		# add data
+		#   N.B. for one value item comma is required to create tuple (as opposed to grouped expression of single string)
+
+		# TABLE android_metadata
+		sql_vals = tuple( ['en_GB'] )
+		new_db_cursor.execute("INSERT INTO android_metadata VALUES (?)", sql_vals )
+
+		# TABLE note
+		new_db_cursor.execute("INSERT INTO note (id,name,created,modified) VALUES (?,?,?,?)", (uuid,nn,ts,ts) )
+	
+		# TABLE document (PDF backgrounds)
+		documentId = ''
+		pdf_sql_vals = docs_by_note[uuid]
+		if pdf_sql_vals :
+			new_db_cursor.executemany("INSERT INTO document(documentId,noteId) VALUES (?,?)", pdf_sql_vals )
+			# collect ids of pdf file(s) to copy to Zip archive
+			for documentId, noteId in pdf_sql_vals :
+				pdf_set.add( documentId )
+
+		# TABLE page
+		page_sql_vals = pages_by_note[uuid]
+		page_sql_vals_ext = [ (*page_sql_val, documentId) for page_sql_val in page_sql_vals ]
+		if page_sql_vals_ext :
+			new_db_cursor.executemany("INSERT INTO page(id,noteId,created,modified,pageNum,documentId) VALUES (?,?,?,?,?,?)",
+										page_sql_vals_ext )
+
+		# TABLE image one entry for every image in every page
+		# loop over pages
+		for (page_uuid,note_uuid,created,modified,page_num) in page_sql_vals :
+			img_sql_vals = images_by_page[page_uuid]
+			if img_sql_vals :
+				new_db_cursor.executemany("INSERT INTO image(imageId,pageId,toDelete) VALUES (?,?,?)", img_sql_vals )
+				# collect ids of image file(s) to copy to Zip archive
+				for imageId, pageId, toDelete in img_sql_vals :
+					image_set.add( imageId )
+
+		new_db_conn.commit()
+
+		# serialise new database and add it to note Zip archive
+		db_bytes = new_db_conn.serialize()
+		new_db_conn.close()
+		sn.writestr( 'note.db', db_bytes )
+
+#		# copy new database to current directory
+#		with open( 'note.db', 'wb' ) as o_file :
+#			o_file.write( db_bytes )
+
+		# add .metadata an note.page to data/pages/
+		sn.writestr( 'data/pages/.metadata', b'' )
+		page_set = { page_uuid for (page_uuid,note_uuid,created,modified,page_num) in page_sql_vals }
+		l = len( page_set )
+		# copy in backup archive order to keep reads sequential
+		page_infos = sorted( [ info_by_name[f'data/pages/{page}.page'] for page in page_set ], key=lambda info : info.header_offset )
+		for info in page_infos :
+			sn.writestr( info.filename, sn_bup.read( info ), compress_type=zipfile.ZIP_STORED )
+		mprint( f'Written {l} file(s) to "data/pages"' )
+	
+		# add .metadata and images to data/imgs/
+		sn.writestr( 'data/imgs/.metadata', b'' )
+		# copy images
+#		print( 'images: ', image_set )
+		l = len( image_set )
+		# copy in backup archive order to keep reads sequential
+		image_infos = sorted( [ info_by_name[f'data/imgs/{image}'] for image in image_set ], key=lambda info : info.header_offset )
+		for info in image_infos :
+			sn.writestr( info.filename, sn_bup.read( info ), compress_type=zipfile.ZIP_STORED )
+		mprint( f'Written {l} file(s) to "data/imgs"' )
+	
+		# add .metadata and background PDFs to data/docs/
+		sn.writestr( 'data/docs/.metadata', b'' )
+		# copy background PDFs
+#		print( 'pdfs:   ', pdf_set )
+		l = len( pdf_set )
+		# copy in backup archive order to keep reads sequential
+		pdf_infos = sorted( [ info_by_name[f'data/docs/{pdf}'] for pdf in pdf_set ], key=lambda info : info.header_offset )
+		for info in pdf_infos :
+			sn.writestr( info.filename, sn_bup.read( info ), compress_type=zipfile.ZIP_STORED )
+		mprint( f'Written {l} file(s) to "data/docs"' )
+
 ########################################
 def main( ) :
 	"""
@@ -124,6 +308,7 @@ def main( ) :
 
 	# programmatically import all libraries listed at the top
 	import_libraries()
+	compile_patterns()
 
 	# process command line arguments
 	parser = argparse.ArgumentParser(
@@ -147,11 +332,17 @@ def main( ) :
 		exit()
 	quiet = args.quiet
 	if not args.regex :
-		regex = re.compile( '.*' )
+		# no pattern given, all notes are selected
+		regex = None
 	else :
 		regex = re.compile( args.regex )
 	if args.dry_run :
 		mprint( f'This is a dry run, no files will be written', colour=CYELLOW )
+	if args.extract and sys.version_info < (3, 11) :
+		# sqlite3 Connection.serialize(), used to write note.db, was added in Python 3.11
+		#   N.B. printed directly, so the error is shown even with --quiet
+		print( CRED, 'Extracting notes requires Python 3.11 or newer', CEND, file=sys.stderr )
+		exit()
 	snb_file = args.filename
 	mprint( f'Input file:  "{snb_file}"', colour=CGREEN )
 
@@ -169,18 +360,44 @@ def main( ) :
 			conn = sqlite3.connect(db_path)
 			mprint( f'Connected to input sqlite3 database {db_path}', colour=CGREEN )
 			# run query to get list of all notes
+			#   N.B. a --regex without metacharacters is a plain prefix for re.match(), so let SQLite
+			#   preselect matching notes with GLOB (case sensitive, like re.match). This is skipped if
+			#   the pattern could match the formatted mtime, and notes without a name are always kept
+			#   as they are given one below. The regex is still applied to every row returned.
+			sql_filter = ''
+			sql_args = ()
+			if args.regex and not any( c in '.^$*+?{}[]\\|()' for c in args.regex ) \
+					and not all( c in '0123456789-: ' for c in args.regex ) :
+				sql_filter = " WHERE id GLOB ? OR name GLOB ? OR name IS NULL OR name = ''"
+				sql_args = ( args.regex + '*', ) * 2
 			cur = conn.cursor()
-			cur.execute( "SELECT id, name, modified FROM note ORDER BY modified ASC" )
+			cur.execute( "SELECT id, name, modified FROM note" + sql_filter + " ORDER BY modified ASC", sql_args )
 			query_results = cur.fetchall()
 			# fix empty names and timestamp in query_results, and select notes
 			note_list = []
 			for i, (uuid, nn, ts) in enumerate( query_results ) :
+				dt = datetime.datetime.fromtimestamp(ts/1000.0)
 				if not nn :
-					nn = 'Untitled_' + datetime.datetime.fromtimestamp(ts/1000.0).strftime('%Y%m%d-%H%M%S')
-				mtime = datetime.datetime.fromtimestamp(ts/1000.0).strftime('%Y-%m-%d %H:%M:%S')
-				selected = re.match( regex, uuid ) or re.match( regex, nn ) or re.match( regex, mtime )
+					nn = 'Untitled_' + dt.strftime('%Y%m%d-%H%M%S')
+				mtime = dt.strftime('%Y-%m-%d %H:%M:%S')
+				selected = regex is None or regex.match( uuid ) or regex.match( nn ) or regex.match( mtime )
 				if selected :
 					note_list.append( (uuid, nn, mtime, ts) )
+			if args.extract :
+				# fetch documents, pages and images for all notes in one query each,
+				# bucketed by noteId / pageId for lookup in the extraction loop
+				docs_by_note = collections.defaultdict( list )
+				cur.execute( 'SELECT documentId, noteId FROM document' )
+				for row in cur :
+					docs_by_note[row[1]].append( row )
+				pages_by_note = collections.defaultdict( list )
+				cur.execute( 'SELECT id, noteId, created, modified, pageNum FROM page' )
+				for row in cur :
+					pages_by_note[row[1]].append( row )
+				images_by_page = collections.defaultdict( list )
+				cur.execute( 'SELECT imageId, pageId, toDelete FROM image' )
+				for row in cur :
+					images_by_page[row[1]].append( row )
 			conn.close()
 			n_notes = len( note_list )
 			mprint( f'Closed input database connection' )
@@ -192,184 +409,39 @@ def main( ) :
 					print( f'{i+1:04d}/{n_notes:04d}', uuid, f'"{mtime}"', f'"{nn}"' )
 
 			elif args.extract :
-				for i, (uuid, nn, mtime, ts) in enumerate( note_list ) :
-					sn_file = slugify(nn) + '.squidnote'
-#					sn_file = uuid+'.squidnote.zip'
-					# open ZipFile archive for note being extracted				
-					with zipfile.ZipFile( sn_file, 'w' ) as sn :
-						mprint( f'Opened new squidnote archive for writing' )
-						
-						images = []
-						pdfs = []
-						
-						# create info.json
-						with sn.open( 'info.json', 'w' ) as o_file :
-							o_file.write( (f'{{"id":"{uuid}","name":"{nn}","modified":{ts},"version":1}}').encode() )
-
-						# open database for backup archive
-						bup_db_conn = sqlite3.connect(db_path)
-						bup_db_cursor = bup_db_conn.cursor()
-
-						mprint( f'Connected to input sqlite3 database {db_path}' )
-
-						with tempfile.TemporaryDirectory() as new_db_dirpath :
-							# crete note.db
-							new_db_path = new_db_dirpath + '/note.db'
-							new_db_conn = sqlite3.connect( new_db_path )
-							new_db_cursor = new_db_conn.cursor()
-							sql_cmds = {
-								'''CREATE TABLE android_metadata (locale TEXT)''',
-								'''CREATE TABLE document(
-									documentId TEXT NOT NULL,
-									noteId TEXT NOT NULL,
-									encryptedPassword TEXT
-								)''',
-								'''CREATE TABLE folder(
-									id TEXT PRIMARY KEY NOT NULL,
-									name TEXT NOT NULL,
-									created INTEGER NOT NULL,
-									trashed INTEGER,
-									parentId TEXT
-								)''',
-								'''CREATE TABLE image( imageId TEXT NOT NULL, pageId TEXT NOT NULL, toDelete INTEGER NOT NULL )''',
-								'''CREATE TABLE manifest( revision INTEGER NOT NULL )''',
-								'''CREATE TABLE note(
-									id TEXT PRIMARY KEY NOT NULL,
-									name TEXT NOT NULL,
-									created INTEGER NOT NULL,
-									modified INTEGER NOT NULL,
-									starred INTEGER NOT NULL DEFAULT 0,
-									uiMode INTEGER NOT NULL DEFAULT 0,
-									currentPageNum INTEGER NOT NULL DEFAULT 0,
-									passwordHash TEXT,
-									version INTEGER NOT NULL DEFAULT 0,
-									trashed INTEGER,
-									parentId TEXT,
-									revision INTEGER NOT NULL DEFAULT 0
-								)''',
-								'''CREATE TABLE page(
-									id TEXT PRIMARY KEY NOT NULL,
-									noteId TEXT NOT NULL,
-									created INTEGER NOT NULL,
-									modified INTEGER NOT NULL,
-									pageNum INTEGER NOT NULL,
-									offsetX REAL NOT NULL DEFAULT 0,
-									offsetY REAL NOT NULL DEFAULT 0,
-									zoom REAL NOT NULL DEFAULT 1,
-									fitMode INTEGER NOT NULL DEFAULT 0,
-									documentId TEXT
-								)'''
-							}
-							for sql_cmd in sql_cmds :
-								new_db_cursor.execute( sql_cmd )
-
-							# add data
-							#   N.B. for one value item comma is required to create tuple (as opposed to grouped expression of single string)
-
-							# TABLE android_metadata
-							sql_vals = tuple( ['en_GB'] )
-							new_db_cursor.execute("INSERT INTO android_metadata VALUES (?)", sql_vals )
-							new_db_conn.commit()
-
-							# TABLE note
-							new_db_cursor.execute("INSERT INTO note (id,name,created,modified) VALUES (?,?,?,?)", (uuid,nn,ts,ts) )
-							new_db_conn.commit()
-							
-							# TABLE document (PDF backgrounds)
-							documentId = ''
-							bup_db_cursor.execute( f'SELECT documentId, noteId FROM document WHERE noteId IS "{uuid}"' )
-							pdf_sql_vals = bup_db_cursor.fetchall()
-							if pdf_sql_vals :
-								new_db_cursor.executemany("INSERT INTO document(documentId,noteId) VALUES (?,?)", pdf_sql_vals )
-								new_db_conn.commit()
-								# copy pdf file(s) to Zip archive
-								for documentId, noteId in pdf_sql_vals :
-									pdfs.append( documentId )
-
-							# TABLE page
-							bup_db_cursor.execute( f'SELECT id, noteId, created, modified, pageNum FROM page WHERE noteId IS "{uuid}"' )
-							page_sql_vals = bup_db_cursor.fetchall()
-							page_sql_vals_ext = [ (*page_sql_val, documentId) for page_sql_val in page_sql_vals ]
-							if page_sql_vals_ext :
-								new_db_cursor.executemany("INSERT INTO page(id,noteId,created,modified,pageNum,documentId) VALUES (?,?,?,?,?,?)",
-															page_sql_vals_ext )
-								new_db_conn.commit()
-
-							# TABLE image one entry for every image in every page
-							# loop over pages
-							for (page_uuid,note_uuid,created,modified,page_num) in page_sql_vals :
-								bup_db_cursor.execute( f'SELECT imageId, pageId, toDelete FROM image WHERE pageId IS "{page_uuid}"' )
-								img_sql_vals = bup_db_cursor.fetchall()
-								if img_sql_vals :
-									new_db_cursor.executemany("INSERT INTO image(imageId,pageId,toDelete) VALUES (?,?,?)", img_sql_vals )
-									new_db_conn.commit()
-									# copy image file)s) to Zip archive
-									for imageId, pageId, toDelete in img_sql_vals :
-										images.append( imageId )
-
-							new_db_conn.close()
-							bup_db_conn.close()
-							# copy new database to note Zip archive
-							with sn.open( 'note.db', 'w' ) as o_file :
-								with open(new_db_path, 'rb') as i_file:
-									shutil.copyfileobj( i_file, o_file)
-									i_file.close()
-								o_file.close()
-
-#							# copy new database to current directory
-#							with open( 'note.db', 'wb' ) as o_file :
-#								with open(new_db_path, 'rb') as i_file:
-#									shutil.copyfileobj( i_file, o_file)
-#									i_file.close()
-#								o_file.close()
-
-						# add .metadata an note.page to data/pages/
-						with sn.open( 'data/pages/.metadata', 'w' ) as o_file :
-							o_file.write( ('').encode() )
-						page_set = list( set( [ page_uuid for (page_uuid,note_uuid,created,modified,page_num) in page_sql_vals ] ) )
-						l = len( page_set )
-						for page in page_set :
-							with sn.open( f'data/pages/{page}.page', 'w' ) as o_file :
-								with sn_bup.open( f'data/pages/{page}.page', 'r' ) as i_file:
-									shutil.copyfileobj( i_file, o_file)
-									i_file.close()
-								o_file.close()
-						mprint( f'Written {l} file(s) to "data/pages"' )
-						
-						# add .metadata and images to data/imgs/
-						with sn.open( 'data/imgs/.metadata', 'w' ) as o_file :
-							o_file.write( ('').encode() )
-						# copy images
-#						print( 'images: ', list( set( images ) ) )
-						image_set = list( set( images ) )
-						l = len( image_set )
-						for image in image_set :
-							with sn.open( f'data/imgs/{image}', 'w' ) as o_file :
-								with sn_bup.open( f'data/imgs/{image}', 'r' ) as i_file:
-									shutil.copyfileobj( i_file, o_file)
-									i_file.close()
-								o_file.close()
-						mprint( f'Written {l} file(s) to "data/imgs"' )
-						
-						# add .metadata and background PDFs to data/docs/
-						with sn.open( 'data/docs/.metadata', 'w' ) as o_file :
-							o_file.write( ('').encode() )
-						# copy background PDFs
-#						print( 'pdfs:   ', list( set( pdfs ) ) )
-						pdf_set = list( set( pdfs ) )
-						l = len( pdf_set )
-						for pdf in pdf_set :
-							with sn.open( f'data/docs/{pdf}', 'w' ) as o_file :
-								with sn_bup.open( f'data/docs/{pdf}', 'r' ) as i_file:
-									shutil.copyfileobj( i_file, o_file)
-									i_file.close()
-								o_file.close()
-						mprint( f'Written {l} file(s) to "data/docs"' )
-
-
-
-						sn.close()
-						mprint( f'{i+1:04d}/{n_notes:04d}', f'Extracted squidnote "{sn_file}"', colour=CGREEN )
+				# note names are not unique, so several notes can map to the same output file;
+				# keep only the last (most recently modified) one, as extracting them in turn would
+				notes_by_file = {}
+				for note in note_list :
+					sn_file = slugify( note[1] ) + '.squidnote'
+#					sn_file = note[0]+'.squidnote.zip'
+					notes_by_file[sn_file] = note
+				if len( notes_by_file ) < n_notes :
+					mprint( f'Skipping {n_notes - len( notes_by_file )} note(s) with a duplicate output file name', colour=CYELLOW )
+				n_notes = len( notes_by_file )
+				# extract notes in parallel, each worker writes its own squidnote archive
+				n_workers = min( 8, os.cpu_count() or 1 )
+				worker_state = threading.local()
+				opened = []
+				try :
+					with futures.ThreadPoolExecutor( max_workers=n_workers, initializer=open_backup_archive,
+														initargs=( worker_state, snb_file, opened ) ) as executor :
+						jobs = { executor.submit( extract_note, note, sn_file, worker_state, docs_by_note, pages_by_note, images_by_page ) : sn_file
+									for sn_file, note in notes_by_file.items() }
+						# report progress in order of completion and re-raise any exception raised in a worker
+						#   N.B. on the first failure notes not yet started are cancelled, but notes already
+						#   being extracted by other workers are still finished before the error is raised
+						for i, job in enumerate( futures.as_completed( jobs ) ) :
+							try :
+								job.result()
+							except :
+								for pending_job in jobs :
+									pending_job.cancel()
+								raise
+							mprint( f'{i+1:04d}/{n_notes:04d}', f'Extracted squidnote "{jobs[job]}"', colour=CGREEN )
+				finally :
+					for worker_sn_bup in opened :
+						worker_sn_bup.close()
 
 #	if not args.dry_run :
 #		pass